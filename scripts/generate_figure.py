@@ -6,24 +6,26 @@
 import numpy as np
 
 from sudanese_mobius.parameters import GridParameters
-from sudanese_mobius.S3_parameterization import mobius_strip_s3
-from sudanese_mobius.stereo_projection import stereographic_projection
-from sudanese_mobius.curvature import gaussian_curvature_S3
-from sudanese_mobius.curvature import comp_curve_data
+from sudanese_mobius.S3_parameterization import mobius_strip_s3_derivatives
+from sudanese_mobius.stereo_projection import stereographic_projection_derivatives
+from sudanese_mobius.curvature import gaussian_curvature_S3_from_derivatives
+from sudanese_mobius.curvature import comp_curve_data_from_derivatives
 from sudanese_mobius.visualization import plot_surface
 
-def main():
-    params = GridParameters()
-    u, v = np.meshgrid(params.u, params.v, indexing="ij")
-    du = params.u[1] - params.u[0]
-    dv = params.v[1] - params.v[0]
-    
-    x = mobius_strip_s3(u, v)
-    c, scale = stereographic_projection(x)
-    K_S3 = gaussian_curvature_S3(x, du, dv)
-    curvatureData = comp_curve_data(c, scale, K_S3, du, dv)
+def main(stride=4, compute_at_stride=True, dtype=np.float64):
+    params = GridParameters(dtype=dtype)
+    if compute_at_stride:
+        # Only every stride-th point is rendered, so compute on that grid.
+        # The derivatives are exact, so the plotted values are unchanged
+        params = params.downsample(stride)
+        stride = 1
+
+    x = mobius_strip_s3_derivatives(params.u, params.v)
+    c, scale = stereographic_projection_derivatives(x)
+    K_S3 = gaussian_curvature_S3_from_derivatives(x)
+    curvatureData = comp_curve_data_from_derivatives(c, scale, K_S3)
     
-    plot_surface(c, curvatureData, K_S3=K_S3, scale=scale, stride=4)
+    plot_surface(c.r, curvatureData, K_S3=K_S3, scale=scale, stride=stride)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
+from .curvature import SurfaceDerivatives
 
 def mobius_strip_s3(u, v, twist=0.5):
     """
@@ -12,33 +13,107 @@ def mobius_strip_s3(u, v, twist=0.5):
     yields a torus instead. The resulting surface is rotated slightly
     to avoid contact with the north pole of the 3-sphere.
 
+    The parameterization is separable in `u` and `v`, so both are taken as
+    1D vectors and the trigonometric terms are evaluated once per grid line
+    before being broadcast onto the full (len(u), len(v)) grid.
+
     Parameters
     ----------
     u : ndarray
-        First grid parameter (e.g., `u_min ≤ u ≤ u_max`).
+        1D array of the first grid parameter (e.g., `u_min ≤ u ≤ u_max`).
     v : ndarray
-        Second grid parameter (e.g., `v_min ≤ v ≤ v_max`).
+        1D array of the second grid parameter (e.g., `v_min ≤ v ≤ v_max`).
     twist : float
         Embedding twist factor set to 0.5.
 
     Returns
     -------
     x : ndarray
-        Array of points (shape: (..., 4) representing the surface in S3.
+        Array of points (shape: (4, len(u), len(v)) representing the surface
+        in S3.
+    """ 
+    a, b, p, q = _v_factors(v, twist)
+    cos_u, sin_u = np.cos(u)[:, None], np.sin(u)[:, None]
+
+    return _rotated_components(cos_u, sin_u, a, b, p, q)
+
+
+def mobius_strip_s3_derivatives(u, v, twist=0.5):
+    """
+    Mobius strip in S3 together with its exact first and second partial
+    derivatives.
+
+    Uses the same parameterization as `mobius_strip_s3`. Every component is
+    a sum of products f(u) * g(v) of sines and cosines, so the derivatives
+    follow from differentiating the 1D factors and need no finite
+    differences.
+
+    Parameters
+    ----------
+    u : ndarray
+        1D array of the first grid parameter (e.g., `u_min ≤ u ≤ u_max`).
+    v : ndarray
+        1D array of the second grid parameter (e.g., `v_min ≤ v ≤ v_max`).
+    twist : float
+        Embedding twist factor set to 0.5.
+
+    Returns
+    -------
+    SurfaceDerivatives
+        The surface `x` in S3 and its partial derivatives, each of shape
+        (4, len(u), len(v)).
     """ 
-    x1 = np.cos(u) * np.cos(v)
-    x2 = np.cos(u) * np.sin(v)
-    x3 = np.sin(u) * np.cos(twist * v)
-    x4 = np.sin(u) * np.sin(twist * v)
-
-    x = np.stack([x1, x2, x3, x4], axis=-1)
-
-    # Rotation to avoid pole singularity
-    R = 0.5 * np.array([
-        [ 1, -1, -1, -1],
-        [ 1,  1, -1,  1],
-        [ 1,  1,  1, -1],
-        [ 1, -1,  1,  1]
-    ])
-
-    return x @ R.T
+    a, b, p, q = _v_factors(v, twist)
+    cos_u, sin_u = np.cos(u)[:, None], np.sin(u)[:, None]
+    t2 = twist * twist
+
+    # d/dv of the v factors: a' = -b, b' = a, p' = t*q, q' = -t*p
+    # d/du of the u factors: cos_u' = -sin_u, sin_u' = cos_u
+    # so the second u derivative is simply -r
+    r = _rotated_components(cos_u, sin_u, a, b, p, q)
+    return SurfaceDerivatives(
+        r=r,
+        r_u=_rotated_components(-sin_u, cos_u, a, b, p, q),
+        r_v=_rotated_components(cos_u, sin_u, -b, a, twist*q, -twist*p),
+        r_uu=np.negative(r),
+        r_uv=_rotated_components(-sin_u, cos_u, -b, a, twist*q, -twist*p),
+        r_vv=_rotated_components(cos_u, sin_u, -a, -b, -t2*p, -t2*q),
+    )
+
+
+def _v_factors(v, twist):
+    # The unrotated surface is
+    #   (cos_u cos_v, cos_u sin_v, sin_u cos_tv, sin_u sin_tv)
+    # and is rotated off the pole singularity by the orthogonal matrix
+    #   R = 0.5 * [[1, -1, -1, -1],
+    #              [1,  1, -1,  1],
+    #              [1,  1,  1, -1],
+    #              [1, -1,  1,  1]]
+    # R is folded into the v dependent factors so each rotated component
+    # is a single cos_u * f(v) +/- sin_u * g(v)
+    cos_v, sin_v = np.cos(v), np.sin(v)
+    cos_tv, sin_tv = np.cos(twist * v), np.sin(twist * v)
+
+    a = (0.5 * (cos_v - sin_v))[None, :]
+    b = (0.5 * (cos_v + sin_v))[None, :]
+    p = (0.5 * (cos_tv + sin_tv))[None, :]
+    q = (0.5 * (cos_tv - sin_tv))[None, :]
+    return a, b, p, q
+
+
+def _rotated_components(cos_u, sin_u, a, b, p, q):
+    # Components are written straight into the output instead of stacking,
+    # with the shared products formed in place so the only temporary is a
+    # single scratch plane
+    x = np.empty_like(cos_u, shape=(4,) + np.broadcast_shapes(cos_u.shape, a.shape))
+    tmp = np.empty_like(x[0])
+    np.multiply(cos_u, a, out=x[3])
+    np.multiply(sin_u, p, out=tmp)
+    np.subtract(x[3], tmp, out=x[0])
+    x[3] += tmp
+    np.multiply(cos_u, b, out=x[2])
+    np.multiply(sin_u, q, out=tmp)
+    np.subtract(x[2], tmp, out=x[1])
+    x[2] += tmp
+
+    return x
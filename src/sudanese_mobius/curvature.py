@@ -11,25 +11,242 @@ class CurvatureData:
     scale_factor: np.ndarray
 
 
+@dataclass
+class SurfaceDerivatives:
+    r: np.ndarray
+    r_u: np.ndarray
+    r_v: np.ndarray
+    r_uu: np.ndarray
+    r_uv: np.ndarray
+    r_vv: np.ndarray
+
+
+# Grid points per block when assembling the curvatures, small enough that
+# the ~20 per-point temporaries of a block stay in cache
+_BLOCK_POINTS = 16384
+
+
+def _row_blocks(shape):
+    # Index tuples covering a (..., rows, cols) grid in blocks of whole rows
+    rows = max(1, _BLOCK_POINTS // shape[-1])
+    for start in range(0, shape[-2], rows):
+        yield (Ellipsis, slice(start, start + rows), slice(None))
+
+
+def _fields(sd):
+    return sd.r, sd.r_u, sd.r_v, sd.r_uu, sd.r_uv, sd.r_vv
+
+
+def _gradient(a, h, axis, out=None):
+    # Second order accurate finite difference along `axis`, equivalent to
+    # np.gradient(a, h, axis=axis, edge_order=2) but written into `out`
+    if a.shape[axis] < 3:
+        raise ValueError(
+            "at least 3 points are needed along each axis for second order "
+            f"finite differences, got {a.shape[axis]}"
+        )
+    if out is None:
+        out = np.empty_like(a)
+    a_ax = np.moveaxis(a, axis, 0)
+    out_ax = np.moveaxis(out, axis, 0)
+
+    #Central differences on the interior
+    if axis % a.ndim == a.ndim - 1 and a.flags.c_contiguous \
+            and out.flags.c_contiguous:
+        # Along the contiguous last axis, difference the flattened arrays
+        # in one unit stride sweep. The values this leaves at the start and
+        # end of every row are overwritten by the edge stencils below
+        a_flat, out_flat = a.reshape(-1), out.reshape(-1)
+        np.subtract(a_flat[2:], a_flat[:-2], out=out_flat[1:-1])
+        out_flat[1:-1] *= 0.5 / h
+    else:
+        np.subtract(a_ax[2:], a_ax[:-2], out=out_ax[1:-1])
+        out_ax[1:-1] *= 0.5 / h
+
+    #One sided differences on the edges
+    out_ax[0] = (-1.5*a_ax[0] + 2.0*a_ax[1] - 0.5*a_ax[2]) / h
+    out_ax[-1] = (1.5*a_ax[-1] - 2.0*a_ax[-2] + 0.5*a_ax[-3]) / h
+    return out
+
+
+def _second_difference(a, h, axis, out=None):
+    # Second order accurate second derivative along `axis` from the compact
+    # three point stencil, taken straight from `a` rather than by
+    # differentiating a first derivative twice (a 5 point wide stencil).
+    # The one sided edge stencils need 4 points, so shorter axes fall back
+    # to differentiating twice, as np.gradient did
+    if a.shape[axis] < 4:
+        return _gradient(_gradient(a, h, axis), h, axis, out=out)
+    if out is None:
+        out = np.empty_like(a)
+    a_ax = np.moveaxis(a, axis, 0)
+    out_ax = np.moveaxis(out, axis, 0)
+    inv_h2 = 1.0 / (h * h)
+
+    #Central differences on the interior
+    np.subtract(a_ax[2:], a_ax[1:-1], out=out_ax[1:-1])
+    out_ax[1:-1] -= a_ax[1:-1]
+    out_ax[1:-1] += a_ax[:-2]
+    out_ax[1:-1] *= inv_h2
+
+    #One sided differences on the edges
+    out_ax[0] = (2.0*a_ax[0] - 5.0*a_ax[1] + 4.0*a_ax[2] - a_ax[3]) * inv_h2
+    out_ax[-1] = (2.0*a_ax[-1] - 5.0*a_ax[-2] + 4.0*a_ax[-3] - a_ax[-4]) * inv_h2
+    return out
+
+
+def _gradients(a, du, dv):
+    # Partial derivatives along both grid axes (the last two axes of `a`),
+    # the analogue of np.gradient(a, du, dv, axis=(-2, -1), edge_order=2)
+    return _gradient(a, du, axis=-2), _gradient(a, dv, axis=-1)
+
+
+def _cross3(a, b):
+    # Cross product in R3 with components along the first axis. Written out
+    # per component plane, this is faster than np.cross(axis=0), which
+    # moves the component axis last, and than an einsum against eps_ijk
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+
+    # Each component is accumulated in place with a single scratch plane
+    n = np.empty_like(a)
+    tmp = np.empty_like(a0)
+    np.multiply(a1, b2, out=n[0])
+    n[0] -= np.multiply(a2, b1, out=tmp)
+    np.multiply(a2, b0, out=n[1])
+    n[1] -= np.multiply(a0, b2, out=tmp)
+    np.multiply(a0, b1, out=n[2])
+    n[2] -= np.multiply(a1, b0, out=tmp)
+    return n
+
+
+def _cross4(a, b, c):
+    # Generalised cross product in R4, n_i = eps_ijkl a_j b_k c_l. The
+    # Levi-Civita contraction is expanded through the six 2x2 minors of
+    # (b, c), which avoids gathering 3 component subsets of each input.
+    # Components are stored along the first axis
+    a0, a1, a2, a3 = a
+    b0, b1, b2, b3 = b
+    c0, c1, c2, c3 = c
+
+    p01 = b0*c1 - b1*c0
+    p02 = b0*c2 - b2*c0
+    p03 = b0*c3 - b3*c0
+    p12 = b1*c2 - b2*c1
+    p13 = b1*c3 - b3*c1
+    p23 = b2*c3 - b3*c2
+
+    # Each component is accumulated in place with a single scratch plane
+    n = np.empty_like(a)
+    tmp = np.empty_like(a0)
+    np.multiply(a1, p23, out=n[0])
+    n[0] -= np.multiply(a2, p13, out=tmp)
+    n[0] += np.multiply(a3, p12, out=tmp)
+    np.multiply(a2, p03, out=n[1])
+    n[1] -= np.multiply(a0, p23, out=tmp)
+    n[1] -= np.multiply(a3, p02, out=tmp)
+    np.multiply(a0, p13, out=n[2])
+    n[2] -= np.multiply(a1, p03, out=tmp)
+    n[2] += np.multiply(a3, p01, out=tmp)
+    np.multiply(a1, p02, out=n[3])
+    n[3] -= np.multiply(a0, p12, out=tmp)
+    n[3] -= np.multiply(a2, p01, out=tmp)
+    return n
+
+
+def _dot(a, b):
+    # Pointwise dot product over the component (first) axis without a
+    # product temporary
+    return np.einsum("i...,i...->...", a, b)
+
+
+def _fundamental_forms(xu, xv, xuu, xuv, xvv, n):
+    # Coefficients of the first (E, F, G) and second (L, M, N) fundamental
+    # forms from the surface derivatives and unit normal. Each coefficient
+    # is a single einsum pass, so no componentwise products are stored
+    E = _dot(xu, xu)
+    F = _dot(xu, xv)
+    G = _dot(xv, xv)
+
+    L = _dot(xuu, n)
+    M = _dot(xuv, n)
+    N = _dot(xvv, n)
+    return E, F, G, L, M, N
+
+
+def finite_differences(r, du, dv):
+    """
+    Partial derivatives of a sampled surface by finite differences.
+
+    Second order central differences are used on the interior of the grid
+    and second order one sided differences on its edges, so the grid needs
+    at least 3 points along each axis.
+
+    Parameters
+    ----------
+    r : ndarray
+        Array of points (shape: (k, ...) representing a surface in R^k on
+        a uniform (u, v) grid spanning the last two axes.
+    du : float
+        Grid spacing in the u direction for finite differences
+    dv : float
+        Grid spacing in the v direction for finite differences
+
+    Returns
+    -------
+    SurfaceDerivatives
+        `r` and its first and second partial derivatives, each with the
+        shape of `r`.
+    """
+    r_u, r_v = _gradients(r, du, dv)
+    r_uu = _second_difference(r, du, axis=-2)
+    r_uv = _gradient(r_u, dv, axis=-1)
+    r_vv = _second_difference(r, dv, axis=-1)
+    return SurfaceDerivatives(r, r_u, r_v, r_uu, r_uv, r_vv)
+
+
 def gaussian_curvature_S3(x, du, dv):
     """
     Gaussian Curvature Calculation.
 
-    Here K_0 is 1 since S_3 has a curvature of 1 and the below formula is used
-    K_S3 = (L*N - M**2) / (E*G - F**2) + K_0
-    where L,N,M,E,G, and F are calculated as the entries of the first and 
-    second fundamental forms of the surface in S3.
+    The derivatives of `x` are estimated by finite differences, see
+    `gaussian_curvature_S3_from_derivatives`.
 
     Parameters
     ----------
     x : ndarray
-        Array of points (shape: (..., 4) representing the surface in S3.
+        Array of points (shape: (4, ...) representing the surface in S3.
     du : float
         Grid spacing in the u direction for finite differences
     dv : float
         Grid spacing in the v direction for finite differences
 
 
+    Returns
+    -------
+    K_S3 : ndarray
+        Array of points (shape: (...,) representing the Gaussian Curvature of 
+        the surface in S3.
+    """ 
+    return gaussian_curvature_S3_from_derivatives(finite_differences(x, du, dv))
+
+
+def gaussian_curvature_S3_from_derivatives(xd):
+    """
+    Gaussian Curvature Calculation.
+
+    Here K_0 is 1 since S_3 has a curvature of 1 and the below formula is used
+    K_S3 = (L*N - M**2) / (E*G - F**2) + K_0
+    where L,N,M,E,G, and F are calculated as the entries of the first and 
+    second fundamental forms of the surface in S3.
+
+    Parameters
+    ----------
+    xd : SurfaceDerivatives
+        The surface in S3 (shape: (4, ...) and its first and second partial
+        derivatives.
+
+
     Returns
     -------
     K_S3 : ndarray
@@ -37,63 +254,44 @@ def gaussian_curvature_S3(x, du, dv):
         the surface in S3.
     """ 
     #Gaussian Curvature in S^3
-    xu = np.gradient(x, du, axis=0, edge_order=2)
-    xv = np.gradient(x, dv, axis=1, edge_order=2)
-
-    xuu = np.gradient(xu, du, axis=0, edge_order=2)
-    xuv = np.gradient(xu, dv, axis=1, edge_order=2)
-    xvv = np.gradient(xv, dv, axis=1, edge_order=2)
-
-    def det3(a, b, c):
-        return (
-            a[...,0]*b[...,1]*c[...,2] +
-            a[...,1]*b[...,2]*c[...,0] +
-            a[...,2]*b[...,0]*c[...,1] -
-            a[...,2]*b[...,1]*c[...,0] -
-            a[...,1]*b[...,0]*c[...,2] -
-            a[...,0]*b[...,2]*c[...,1]
+    K_S3 = np.empty_like(xd.r[0])
+    for rows in _row_blocks(K_S3.shape):
+        K_S3[rows] = _gaussian_curvature_S3_block(
+            *(a[(slice(None),) + rows] for a in _fields(xd))
         )
+    return K_S3
 
+
+def _gaussian_curvature_S3_block(x, xu, xv, xuu, xuv, xvv):
     #Normal Vector
-    n = np.stack([
-        det3(x[...,1:], xu[...,1:], xv[...,1:]),
-       -det3(x[..., [0,2,3]], xu[..., [0,2,3]], xv[..., [0,2,3]]),
-        det3(x[..., [0,1,3]], xu[..., [0,1,3]], xv[..., [0,1,3]]),
-       -det3(x[...,0:3], xu[...,0:3], xv[...,0:3])
-    ], axis=-1)
-
-    n /= np.linalg.norm(n, axis=-1, keepdims=True)
-    
-    #First Fundamental Form Coefs
-    E = np.sum(xu * xu, axis=-1)
-    F = np.sum(xu * xv, axis=-1)
-    G = np.sum(xv * xv, axis=-1)
-    denom = E * G - F**2
+    n = _cross4(x, xu, xv)
+    n *= 1.0 / np.sqrt(_dot(n, n))
     
-    #Second Fundamental Form Coefs
-    L = np.sum(xuu * n, axis=-1)
-    M = np.sum(xuv * n, axis=-1)
-    N = np.sum(xvv * n, axis=-1)
+    #First and Second Fundamental Form Coefs
+    E, F, G, L, M, N = _fundamental_forms(xu, xv, xuu, xuv, xvv, n)
 
-    return (L*N - M**2) / denom + 1
+    # Accumulated in place in E, L and M, which are not needed afterwards
+    denom = np.multiply(E, G, out=E)
+    denom -= F*F
+
+    K_S3 = np.multiply(L, N, out=L)
+    K_S3 -= np.square(M, out=M)
+    K_S3 /= denom
+    K_S3 += 1
+    return K_S3
 
 
 def comp_curve_data(c, scale, K_S3, du, dv):
     """
     Total Curvature Calculation for the surface in R3
 
-    Takes the scale_factor calculated by the stereographic projection and the
-    parameterization in R3 uses the mean curvature formula:
-    H = (L*G - 2*M*F + N*E) / (2 * (E*G - F**2)
-    and the Gaussian curvature formula:
-    (L*N - M**2) / (E*G - F**2) 
-    Where L,N,M,E,G, and F are calculated as the entries of the first and
-    second fundamental forms of the surface in R3.
+    The derivatives of `c` are estimated by finite differences, see
+    `comp_curve_data_from_derivatives`.
 
     Parameters
     ----------
     c : ndarray
-        Array of points (shape: (..., 3) representing the projected surface in
+        Array of points (shape: (3, ...) representing the projected surface in
         R3.
     scale: ndarray
         Array of scalar values at each point (shape: (...,) representing 
@@ -121,66 +319,94 @@ def comp_curve_data(c, scale, K_S3, du, dv):
             Array of scalar values at each point (shape: (...,) representing 
             the surface's scale factor in R3.
     """ 
-    #Mean Curvature Calculations in R^3
-    cu = np.gradient(c, du, axis=0, edge_order=2)
-    cv = np.gradient(c, dv, axis=1, edge_order=2)
+    return comp_curve_data_from_derivatives(
+        finite_differences(c, du, dv), scale, K_S3
+    )
 
-    cuu = np.gradient(cu, du, axis=0, edge_order=2)
-    cuv = np.gradient(cu, dv, axis=1, edge_order=2)
-    cvu = np.gradient(cv, du, axis=1, edge_order=2)
-    cvv = np.gradient(cv, dv, axis=1, edge_order=2)
 
-    
-    #c_n Notation is Shortened to just x y and z of Parameterization
-    xu, xv = cu[..., 0], cv[..., 0] 
-    yu, yv = cu[..., 1], cv[..., 1]
-    zu, zv = cu[..., 2], cv[..., 2]
-    
-    
-    xuu, raw_xuv = cuu[..., 0], cuv[..., 0]
-    raw_xvu, xvv = cvu[..., 0], cvv[..., 0]
-    xuv = 0.5*(raw_xuv + raw_xvu)
-    
-    yuu, raw_yuv = cuu[..., 1], cuv[..., 1]
-    raw_yvu, yvv = cvu[..., 1], cvv[..., 1]
-    yuv = 0.5*(raw_yuv + raw_yvu)
+def comp_curve_data_from_derivatives(cd, scale, K_S3):
+    """
+    Total Curvature Calculation for the surface in R3
+
+    Takes the scale_factor calculated by the stereographic projection and the
+    parameterization in R3 uses the mean curvature formula:
+    H = (L*G - 2*M*F + N*E) / (2 * (E*G - F**2)
+    and the Gaussian curvature formula:
+    (L*N - M**2) / (E*G - F**2) 
+    Where L,N,M,E,G, and F are calculated as the entries of the first and
+    second fundamental forms of the surface in R3.
+
+    Parameters
+    ----------
+    cd : SurfaceDerivatives
+        The projected surface in R3 (shape: (3, ...) and its first and second
+        partial derivatives.
+    scale: ndarray
+        Array of scalar values at each point (shape: (...,) representing 
+        the surface's scale factor in R3.
+    K_S3 : ndarray
+        Array of points (shape: (...,) representing the Gaussian Curvature of 
+        the surface in S3.
+
+
+    Returns
+    -------
+    CurvatureData
+        Data class containg
+        -mean_curvature: ndarray
+            Array of points (shape: (...,) representing the Mean Curvature of 
+            the surface in R3.
+        -gaussian_curvature : ndarray
+            Array of points (shape: (...,) representing the Gaussian Curvature 
+            of the surface in R3.
+        -scale_factor: ndarray
+            Array of scalar values at each point (shape: (...,) representing 
+            the surface's scale factor in R3.
+    """ 
+    #Mean Curvature Calculations in R^3
+    H = np.empty_like(cd.r[0])
+    K_R3 = np.empty_like(cd.r[0])
+    for rows in _row_blocks(H.shape):
+        H[rows], K_R3[rows] = _curvatures_R3_block(
+            *(a[(slice(None),) + rows] for a in _fields(cd)[1:])
+        )
 
-    zuu, raw_zuv = cuu[..., 2], cuv[..., 2]
-    raw_zvu, zvv = cvu[..., 2], cvv[..., 2]
-    zuv = 0.5*(raw_zuv + raw_zvu)
-    
-    #Normal Vector
-    nx_org = yu*zv - zu*yv
-    ny_org = zu*xv - xu*zv
-    nz_org = xu*yv - yu*xv
-    
-    norm_n = np.sqrt(nx_org**2 + ny_org**2 + nz_org**2)
-    
-    nx = nx_org / norm_n
-    ny = ny_org / norm_n
-    nz = nz_org / norm_n
-    
-    #First Fundamental Form Coefs
-    E = xu**2 + yu**2 + zu**2
-    F = xu*xv + yu*yv + zu*zv
-    G = xv**2 + yv**2 + zv**2
-    
-    #Second Fundamental Form Coefs
-    L = xuu*nx + yuu*ny + zuu*nz
-    M = xuv*nx + yuv*ny + zuv*nz
-    N = xvv*nx + yvv*ny + zvv*nz
-    
-    #Mean Curvature
-    denom = (E*G - F**2)
-    
-    H = (L*G - 2*M*F + N*E) / (2 * denom)
-    #Gaussian
-    K_R3 = (L*N - M**2) / denom
-    
     Scale_Factor = scale
-    
+
     return CurvatureData(
     mean_curvature=H,
     gaussian_curvature=K_R3,
     scale_factor=Scale_Factor,
-    )
\ No newline at end of file
+    )
+
+
+def _curvatures_R3_block(cu, cv, cuu, cuv, cvv):
+    #Normal Vector
+    n = _cross3(cu, cv)
+    n *= 1.0 / np.sqrt(_dot(n, n))
+
+    #First and Second Fundamental Form Coefs
+    E, F, G, L, M, N = _fundamental_forms(cu, cv, cuu, cuv, cvv, n)
+
+    # Both curvatures are accumulated in place, reusing one scratch array
+    tmp = np.empty_like(E)
+
+    # 1 / (E*G - F**2) is shared by H and K, so one division serves both
+    inv_denom = np.multiply(E, G)
+    inv_denom -= F*F
+    np.divide(1.0, inv_denom, out=inv_denom)
+
+    #Mean Curvature
+    H = np.multiply(L, G)
+    np.multiply(M, F, out=tmp)
+    tmp *= 2
+    H -= tmp
+    H += np.multiply(N, E, out=tmp)
+    H *= inv_denom
+    H *= 0.5
+    #Gaussian
+    K_R3 = np.multiply(L, N, out=L)
+    K_R3 -= np.square(M, out=M)
+    K_R3 *= inv_denom
+
+    return H, K_R3
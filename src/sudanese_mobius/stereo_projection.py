@@ -2,6 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
+from .curvature import SurfaceDerivatives, _fields, _row_blocks
+
+# Rotation used for visualization,
+#   rot = [[1, 0, 0], [0, s, -s], [0, s, s]],  s = sqrt(2)/2
+# kept as a Python float so it does not upcast single precision input
+_ROT_S = 0.5 ** 0.5
 
 def stereographic_projection(x):
     """
@@ -11,28 +17,115 @@ def stereographic_projection(x):
     Parameters
     ----------
     x : ndarray
-        Array of points (shape: (..., 4)
+        Array of points (shape: (4, ...)
 
     Returns
     -------
     c : ndarray
-        Array of points (shape: (..., 3) representing the projection of the 
+        Array of points (shape: (3, ...) representing the projection of the 
         surface in R3.
     scale: ndarray
         Array of scalar values at each point (shape: (...,) representing 
         the surface's scale factor in R3.
     """ 
-    denom = 1.0 - x[..., 3]
-    c = x[..., :3] / denom[..., None]
+    scale = np.subtract(1.0, x[3])
+    np.divide(1.0, scale, out=scale)
+
+    # Rotate coordinates for visualization, writing every component into
+    # the output array in place
+    c = np.empty_like(x, shape=(3,) + x.shape[1:])
+    _scale_rotate(x, scale, _ROT_S * scale, out=c)
+
+    return c, scale
+
+
+def stereographic_projection_derivatives(xd):
+    """
+    Stereographically projects a surface in S3 together with its first and
+    second partial derivatives.
+
+    With y = x[:3], w = x[3] and the scale factor λ = 1 / (1 - w), the
+    projection is c = y * λ. Its derivatives follow from the chain rule,
+    which with g_a = λ w_a and h_ab = λ w_ab simplifies to
+    c_a = y_a λ + g_a c
+    c_ab = y_ab λ + g_b c_a + g_a c_b + h_ab c
+    for a, b in {u, v}. The same rotation as `stereographic_projection`
+    is applied throughout.
+
+    Parameters
+    ----------
+    xd : SurfaceDerivatives
+        The surface in S3 (shape: (4, ...) and its first and second partial
+        derivatives.
+
+    Returns
+    -------
+    cd : SurfaceDerivatives
+        The projection of the surface in R3 (shape: (3, ...) and its first
+        and second partial derivatives.
+    scale: ndarray
+        Array of scalar values at each point (shape: (...,) representing 
+        the surface's scale factor in R3.
+    """ 
+    c, scale = stereographic_projection(xd.r)
+
+    # Every derivative is written into its output in place, one block of
+    # grid rows at a time so the scratch arrays stay in cache
+    cd = SurfaceDerivatives(c, *(np.empty_like(c) for _ in range(5)))
+    for rows in _row_blocks(scale.shape):
+        _projection_derivatives_block(
+            *(a[rows] for a in _fields(xd)[1:]),
+            scale[rows],
+            *(a[rows] for a in _fields(cd))
+        )
+    return cd, scale
+
+
+def _projection_derivatives_block(x_u, x_v, x_uu, x_uv, x_vv, scale,
+                                  c, c_u, c_v, c_uu, c_uv, c_vv):
+    # g_a = λ w_a, so that λ_a = λ g_a
+    rot_scale = np.multiply(scale, _ROT_S)
+    g_u = np.multiply(scale, x_u[3])
+    g_v = np.multiply(scale, x_v[3])
+    tmp = np.empty_like(c)
+
+    #First derivatives
+    _scale_rotate(x_u, scale, rot_scale, out=c_u)
+    _add_product(c_u, g_u, c, tmp)
+    _scale_rotate(x_v, scale, rot_scale, out=c_v)
+    _add_product(c_v, g_v, c, tmp)
+
+    #Second derivatives, with h_ab = λ w_ab
+    h = np.empty_like(scale)
+    _scale_rotate(x_uv, scale, rot_scale, out=c_uv)
+    _add_product(c_uv, g_v, c_u, tmp)
+    _add_product(c_uv, g_u, c_v, tmp)
+    _add_product(c_uv, np.multiply(scale, x_uv[3], out=h), c, tmp)
+
+    # The two cross terms of c_uu and c_vv coincide
+    _scale_rotate(x_uu, scale, rot_scale, out=c_uu)
+    g_u *= 2.0
+    _add_product(c_uu, g_u, c_u, tmp)
+    _add_product(c_uu, np.multiply(scale, x_uu[3], out=h), c, tmp)
+    _scale_rotate(x_vv, scale, rot_scale, out=c_vv)
+    g_v *= 2.0
+    _add_product(c_vv, g_v, c_v, tmp)
+    _add_product(c_vv, np.multiply(scale, x_vv[3], out=h), c, tmp)
+
 
-    # Rotate coordinates for visualization
-    rot = np.array([
-        [1, 0, 0],
-        [0, np.sqrt(2)/2, -np.sqrt(2)/2],
-        [0, np.sqrt(2)/2,  np.sqrt(2)/2]
-    ])
+def _scale_rotate(x, scale, rot_scale, out):
+    # out = rot @ (x[:3] * scale), with rot_scale = _ROT_S * scale. The
+    # rotation only mixes the last two components, so its coefficient is
+    # folded into the scale factor
+    np.multiply(x[0], scale, out=out[0])
+    np.subtract(x[1], x[2], out=out[1])
+    out[1] *= rot_scale
+    np.add(x[1], x[2], out=out[2])
+    out[2] *= rot_scale
+    return out
 
-    c = c @ rot.T
-    scale = 1.0 / denom
 
-    return c, scale
\ No newline at end of file
+def _add_product(out, s, y, tmp):
+    # out += s * y in place, for y of shape (3, ...) and s of shape (...,)
+    out += np.multiply(y, s, out=tmp)
+    return out
@@ -8,6 +8,16 @@ from matplotlib.widgets import RadioButtons
 from typing import Optional
 from .curvature import CurvatureData
 
+def _to_host(a):
+    # CuPy arrays are copied back to host memory for matplotlib
+    return a.get() if hasattr(a, "get") else np.asarray(a)
+
+def _value_range(data):
+    # Non-finite values at singular points are masked out so they do not
+    # skew the color range
+    finite = np.ma.masked_invalid(data)
+    return finite.min(), finite.max()
+
 def plot_surface(
     c: np.ndarray,
     curv: CurvatureData,
@@ -26,11 +36,13 @@ def plot_surface(
     Scale is provided in both the curvature data and directly into the function
     so it can be set as optional.  Meaning if Scale is not provided the
     simulation will still run
+    The inputs may also be CuPy arrays, they are copied back to the host for
+    plotting.
 
     Parameters
     ----------
     c : ndarray
-        Array of points (shape: (..., 3) representing the projection of the 
+        Array of points (shape: (3, ...) representing the projection of the 
         surface in R3.
     curv : CurvatureData
         Data class containg
@@ -63,10 +75,12 @@ def plot_surface(
         The radio button used to control which colormap is shown
     
     """
-    data_lib_full = {
-        "|H|": np.abs(curv.mean_curvature),
-        "$K_{R^3}$": curv.gaussian_curvature,
-        "λ": curv.scale_factor,
+    # Values are only strided, moved to the host and combined when a key is
+    # first shown, so keys that are never selected cost nothing
+    data_sources = {
+        "|H|": lambda: np.abs(curv.mean_curvature[::stride, ::stride]),
+        "$K_{R^3}$": lambda: curv.gaussian_curvature[::stride, ::stride],
+        "λ": lambda: curv.scale_factor[::stride, ::stride],
     }
     
     colorbar_titles = {
@@ -77,21 +91,30 @@ def plot_surface(
     }
     
     if K_S3 is not None:
-        data_lib_full["$K_{S^3} - K_{R^3}$"] = (K_S3 - curv.gaussian_curvature)
+        data_sources["$K_{S^3} - K_{R^3}$"] = lambda: (
+            K_S3[::stride, ::stride] - curv.gaussian_curvature[::stride, ::stride]
+        )
         
     if scale is not None:
-        data_lib_full["λ"] = scale
+        data_sources["λ"] = lambda: scale[::stride, ::stride]
+
+    data_lib = {}
+
+    def get_data(label):
+        if label not in data_lib:
+            data_lib[label] = _to_host(data_sources[label]())
+        return data_lib[label]
         
-    data_lib = {k: v[::stride, ::stride] for k, v in data_lib_full.items()}
-    c_s = c[::stride, ::stride, 0], c[::stride, ::stride, 1], c[::stride, ::stride, 2]
+    c = _to_host(c)
+    c_s = c[0, ::stride, ::stride], c[1, ::stride, ::stride], c[2, ::stride, ::stride]
     
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection="3d")
     plt.subplots_adjust(left=0.25)
     
-    current_data = data_lib[initial_key]
+    current_data = get_data(initial_key)
     
-    vmin, vmax = np.nanmin(current_data), np.nanmax(current_data)
+    vmin, vmax = _value_range(current_data)
     norm = colors.Normalize(vmin=vmin, vmax=vmax)
     cmap = plt.cm.inferno
         
@@ -102,45 +125,46 @@ def plot_surface(
     
     plt.style.use("seaborn-v0_8")
 
-    def draw_surface(data2d, color_norm, cmap_obj):
-        # facecolors must be (n,m,4)
-        face_colors = cmap_obj(color_norm(data2d))
-        X, Y, Z = c_s
-        surf = ax.plot_surface(
-            X, Y, Z,
-            facecolors=face_colors,
-            linewidth=0,
-            antialiased=False,
-            rstride=1, cstride=1, shade=False
-        )
-        return surf
-    
-    surf = draw_surface(current_data, norm, cmap)
-    
+    # The surface is drawn once and colored through its own norm and cmap,
+    # so no RGBA face color array is built and switching keys only swaps
+    # the per-face values. Faces take the value of their first corner,
+    # matching how plot_surface samples facecolors
+    X, Y, Z = c_s
+    surf = ax.plot_surface(
+        X, Y, Z,
+        cmap=cmap, norm=norm,
+        linewidth=0,
+        antialiased=False,
+        rstride=1, cstride=1, shade=False
+    )
+    surf.set_array(current_data[:-1, :-1].ravel())
     
+    # Norm and cmap per key, so switching back to a key that was already
+    # shown skips the min/max pass
+    color_cache = {}
     
     def update_plot(label):
-        nonlocal surf, mappable
-        new_data = data_lib[label]
-        vmin, vmax = np.nanmin(new_data), np.nanmax(new_data)
+        new_data = get_data(label)
+
+        if label not in color_cache:
+            vmin, vmax = _value_range(new_data)
         
-        # Choose normalization & cmap based on data
-        if vmin < 0 < vmax:
-            new_norm = colors.TwoSlopeNorm(vmin=-max(abs(vmin), abs(vmax)), vcenter=0.0, vmax=max(abs(vmin), abs(vmax)))
-            new_cmap = plt.cm.coolwarm
-        else:
-            new_norm = colors.Normalize(vmin=vmin, vmax=vmax)
-            new_cmap = plt.cm.inferno
-                
-                
-        # Remove old surface and redraw
-        if surf is not None:
-            try:
-                surf.remove()
-            except Exception:
-                pass
+            # Choose normalization & cmap based on data
+            if vmin < 0 < vmax:
+                new_norm = colors.TwoSlopeNorm(vmin=-max(abs(vmin), abs(vmax)), vcenter=0.0, vmax=max(abs(vmin), abs(vmax)))
+                new_cmap = plt.cm.coolwarm
+            else:
+                new_norm = colors.Normalize(vmin=vmin, vmax=vmax)
+                new_cmap = plt.cm.inferno
+
+            color_cache[label] = (new_norm, new_cmap)
 
-        surf = draw_surface(new_data, new_norm, new_cmap)
+        new_norm, new_cmap = color_cache[label]
+                
+        # Recolor the existing surface
+        surf.set_norm(new_norm)
+        surf.set_cmap(new_cmap)
+        surf.set_array(new_data[:-1, :-1].ravel())
 
         # Update colorbar
         mappable.set_norm(new_norm)
@@ -153,13 +177,13 @@ def plot_surface(
 
     
     rax = plt.axes([0.02, 0.4, 0.18, 0.25], facecolor="#EAEAF2")
-    radio = RadioButtons(rax, list(data_lib.keys()), active=list(data_lib.keys()).index(initial_key))
+    radio = RadioButtons(rax, list(data_sources.keys()), active=list(data_sources.keys()).index(initial_key))
     radio.on_clicked(update_plot)
     
     fig.radio = radio
     
     # Cosmetic: set aspect
-    Xflat, Yflat, Zflat = c[:, :, 0], c[:, :, 1], c[:, :, 2]
+    Xflat, Yflat, Zflat = c[0], c[1], c[2]
     ax.set_box_aspect([np.ptp(Xflat), np.ptp(Yflat), np.ptp(Zflat)])
     ax.set_title("Visualization of Sudanese Mobius Strip")
 